@@ -13,16 +13,31 @@ from rich.live import Live
 from rich.table import Table
 from rich.layout import Layout
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn
 from rich import box
 from rich.console import Console
 from rich.text import Text
 
 console = Console()
 
+# Values that stay fixed for the lifetime of the process
+BOOT_TIME = psutil.boot_time()
+BOOT_DATETIME = datetime.fromtimestamp(BOOT_TIME)
+CPU_COUNT = psutil.cpu_count(logical=True)
+
+# Slow-changing metrics (disks, system info) are refreshed every N ticks
+SLOW_REFRESH_TICKS = 5
+# Mounted partitions are re-enumerated every N disk refreshes
+PARTITION_REFRESH_TICKS = 10
+
+_partitions = []
+_partition_ticks = 0
+
+_system_info_panel = None
+_uptime_text = None
+
 def get_cpu_usage_per_core():
-    """Get CPU usage percentage for each core."""
-    return psutil.cpu_percent(percpu=True, interval=0.1)
+    """Get CPU usage percentage for each core since the previous call (non-blocking)."""
+    return psutil.cpu_percent(percpu=True, interval=None)
 
 def get_memory_info():
     """Get memory usage information."""
@@ -35,70 +50,112 @@ def get_memory_info():
         "free": memory.free
     }
 
+def get_partitions():
+    """Get mounted partitions, re-enumerating them only every few calls."""
+    global _partitions, _partition_ticks
+    if not _partitions or _partition_ticks >= PARTITION_REFRESH_TICKS:
+        _partitions = [p for p in psutil.disk_partitions() if p.fstype]
+        _partition_ticks = 0
+    _partition_ticks += 1
+    return _partitions
+
 def get_disk_info():
     """Get disk usage information for all mounted partitions."""
     partitions = []
-    for partition in psutil.disk_partitions():
-        if partition.fstype:
-            usage = psutil.disk_usage(partition.mountpoint)
-            partitions.append({
-                "device": partition.device,
-                "mountpoint": partition.mountpoint,
-                "fstype": partition.fstype,
-                "total": usage.total,
-                "used": usage.used,
-                "free": usage.free,
-                "percent": usage.percent
-            })
+    for partition in get_partitions():
+        usage = psutil.disk_usage(partition.mountpoint)
+        partitions.append({
+            "device": partition.device,
+            "mountpoint": partition.mountpoint,
+            "fstype": partition.fstype,
+            "total": usage.total,
+            "used": usage.used,
+            "free": usage.free,
+            "percent": usage.percent
+        })
     return partitions
 
 def get_network_info():
-    """Get network I/O statistics."""
-    return psutil.net_io_counters()
+    """Get network I/O statistics, with counters kept monotonic across wraps."""
+    return psutil.net_io_counters(nowrap=True)
+
+def get_process_info():
+    """Get CPU, memory and status information for all running processes."""
+    processes = []
+    for proc in psutil.process_iter():
+        try:
+            # Read all attributes from a single snapshot of the process
+            with proc.oneshot():
+                processes.append({
+                    "pid": proc.pid,
+                    "name": proc.name(),
+                    "cpu_percent": proc.cpu_percent(),
+                    "memory_percent": proc.memory_percent(),
+                    "status": proc.status()
+                })
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return processes
+
+def format_uptime():
+    """Format the time since boot as days, hours and minutes."""
+    elapsed = int(time.time() - BOOT_TIME)
+    days, rem = divmod(elapsed, 86400)
+    hours, rem = divmod(rem, 3600)
+    return f"{days} days, {hours} hours, {rem // 60} minutes"
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def size_formatter(bytes_value):
     """Format bytes value to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.2f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    exponent = min((int(bytes_value).bit_length() - 1) // 10, 5)
+    return f"{bytes_value / (1 << (10 * exponent)):.2f} {_SIZE_UNITS[exponent]}"
+
+# Column headers for the dashboard tables
+CPU_COLUMNS = ("Core", "Usage %", "Graph")
+MEMORY_COLUMNS = ("Metric", "Value")
+DISK_COLUMNS = ("Device", "Mount", "Type", "Total", "Used", "Free", "Usage %")
+NETWORK_COLUMNS = ("Metric", "Total", "Per Second")
+
+def new_table(title, columns):
+    """Create an empty rounded table with the given column headers."""
+    table = Table(title=title, box=box.ROUNDED)
+    for column in columns:
+        table.add_column(column)
+    return table
+
+# Usage bars for every possible length, one block per 2%
+_CPU_BARS = tuple("█" * i for i in range(51))
+
+def cpu_color(percentage):
+    """Get the display color for a CPU usage percentage."""
+    return "green" if percentage < 50 else "yellow" if percentage < 80 else "red"
 
 def generate_cpu_table(cpu_usage):
     """Generate a table for CPU usage."""
-    cpu_table = Table(title="CPU Usage", box=box.ROUNDED)
-    cpu_table.add_column("Core")
-    cpu_table.add_column("Usage %")
-    cpu_table.add_column("Graph")
+    cpu_table = new_table("CPU Usage", CPU_COLUMNS)
     
     for i, percentage in enumerate(cpu_usage):
-        bar = "█" * int(percentage / 2)
-        color = "green" if percentage < 50 else "yellow" if percentage < 80 else "red"
+        bar = _CPU_BARS[min(int(percentage) >> 1, 50)]
         cpu_table.add_row(
             f"Core {i}", 
             f"{percentage:.1f}%", 
-            Text(bar, style=color)
+            Text(bar, style=cpu_color(percentage))
         )
     return cpu_table
 
 def generate_memory_table(memory_info):
     """Generate a table for memory usage."""
-    memory_table = Table(title="Memory Usage", box=box.ROUNDED)
-    memory_table.add_column("Metric")
-    memory_table.add_column("Value")
+    memory_table = new_table("Memory Usage", MEMORY_COLUMNS)
     
     memory_table.add_row("Total", size_formatter(memory_info["total"]))
     memory_table.add_row("Available", size_formatter(memory_info["available"]))
     memory_table.add_row("Used", size_formatter(memory_info["used"]))
     memory_table.add_row("Free", size_formatter(memory_info["free"]))
     
-    progress = Progress(
-        TextColumn("[bold blue]RAM Usage:"),
-        BarColumn(bar_width=40),
-        TextColumn(f"{memory_info['percent']}%")
-    )
-    progress.add_task("", total=100, completed=memory_info["percent"])
-    
     memory_table.add_row("", "")
     memory_table.add_row("Usage", "")
     
@@ -106,14 +163,7 @@ def generate_memory_table(memory_info):
 
 def generate_disk_table(disk_info):
     """Generate a table for disk usage."""
-    disk_table = Table(title="Disk Usage", box=box.ROUNDED)
-    disk_table.add_column("Device")
-    disk_table.add_column("Mount")
-    disk_table.add_column("Type")
-    disk_table.add_column("Total")
-    disk_table.add_column("Used")
-    disk_table.add_column("Free")
-    disk_table.add_column("Usage %")
+    disk_table = new_table("Disk Usage", DISK_COLUMNS)
     
     for disk in disk_info:
         color = "green" if disk["percent"] < 70 else "yellow" if disk["percent"] < 85 else "red"
@@ -130,63 +180,72 @@ def generate_disk_table(disk_info):
 
 def generate_network_table(prev_net_io, current_net_io, time_diff):
     """Generate a table for network statistics."""
-    network_table = Table(title="Network Statistics", box=box.ROUNDED)
-    network_table.add_column("Metric")
-    network_table.add_column("Total")
-    network_table.add_column("Per Second")
+    network_table = new_table("Network Statistics", NETWORK_COLUMNS)
     
-    # Calculate bytes per second
-    bytes_sent_per_sec = (current_net_io.bytes_sent - prev_net_io.bytes_sent) / time_diff
-    bytes_recv_per_sec = (current_net_io.bytes_recv - prev_net_io.bytes_recv) / time_diff
+    bytes_sent, bytes_recv = current_net_io.bytes_sent, current_net_io.bytes_recv
+    packets_sent, packets_recv = current_net_io.packets_sent, current_net_io.packets_recv
+    
+    # Calculate rates per second
+    bytes_sent_per_sec = (bytes_sent - prev_net_io.bytes_sent) / time_diff
+    bytes_recv_per_sec = (bytes_recv - prev_net_io.bytes_recv) / time_diff
+    packets_sent_per_sec = (packets_sent - prev_net_io.packets_sent) / time_diff
+    packets_recv_per_sec = (packets_recv - prev_net_io.packets_recv) / time_diff
     
     network_table.add_row(
         "Bytes Sent", 
-        size_formatter(current_net_io.bytes_sent),
-        size_formatter(bytes_sent_per_sec) + "/s"
+        size_formatter(bytes_sent),
+        f"{size_formatter(bytes_sent_per_sec)}/s"
     )
     network_table.add_row(
         "Bytes Received", 
-        size_formatter(current_net_io.bytes_recv),
-        size_formatter(bytes_recv_per_sec) + "/s"
+        size_formatter(bytes_recv),
+        f"{size_formatter(bytes_recv_per_sec)}/s"
     )
     network_table.add_row(
         "Packets Sent", 
-        str(current_net_io.packets_sent),
-        f"{(current_net_io.packets_sent - prev_net_io.packets_sent) / time_diff:.2f}/s"
+        str(packets_sent),
+        f"{packets_sent_per_sec:.2f}/s"
     )
     network_table.add_row(
         "Packets Received", 
-        str(current_net_io.packets_recv),
-        f"{(current_net_io.packets_recv - prev_net_io.packets_recv) / time_diff:.2f}/s"
+        str(packets_recv),
+        f"{packets_recv_per_sec:.2f}/s"
     )
     
     return network_table
 
 def generate_system_info():
-    """Generate system information panel."""
-    uname = platform.uname()
-    boot_time = datetime.fromtimestamp(psutil.boot_time())
-    uptime = datetime.now() - boot_time
-    
-    system_info = Table.grid()
-    system_info.add_column()
-    system_info.add_column()
+    """Generate system information panel, building it once and refreshing only the uptime."""
+    global _system_info_panel, _uptime_text
+    if _system_info_panel is None:
+        uname = platform.uname()
+        
+        system_info = Table.grid()
+        system_info.add_column()
+        system_info.add_column()
+        
+        _uptime_text = Text()
+        system_info.add_row("System:", f"{uname.system} {uname.release}")
+        system_info.add_row("Node Name:", uname.node)
+        system_info.add_row("Version:", uname.version)
+        system_info.add_row("Machine:", uname.machine)
+        system_info.add_row("Processor:", uname.processor)
+        system_info.add_row("Boot Time:", f"{BOOT_DATETIME.strftime('%Y-%m-%d %H:%M:%S')}")
+        system_info.add_row("Uptime:", _uptime_text)
+        
+        _system_info_panel = Panel(system_info, title="System Information", border_style="blue")
     
-    system_info.add_row("System:", f"{uname.system} {uname.release}")
-    system_info.add_row("Node Name:", uname.node)
-    system_info.add_row("Version:", uname.version)
-    system_info.add_row("Machine:", uname.machine)
-    system_info.add_row("Processor:", uname.processor)
-    system_info.add_row("Boot Time:", f"{boot_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    system_info.add_row("Uptime:", f"{uptime.days} days, {uptime.seconds//3600} hours, {(uptime.seconds//60)%60} minutes")
-    
-    return Panel(system_info, title="System Information", border_style="blue")
+    _uptime_text.plain = format_uptime()
+    return _system_info_panel
 
 def main():
     """Main function to run the system monitor dashboard."""
-    prev_net_io = psutil.net_io_counters()
+    prev_net_io = get_network_info()
     prev_time = time.time()
     
+    # Prime the CPU counters so the first non-blocking sample is meaningful
+    psutil.cpu_percent(percpu=True, interval=None)
+    
     layout = Layout()
     layout.split_column(
         Layout(name="header"),
@@ -208,8 +267,11 @@ def main():
         Layout(name="network")
     )
     
+    tick = 0
+    
     try:
-        with Live(layout, refresh_per_second=2, screen=True):
+        # Render only when new data arrives instead of on a timer
+        with Live(layout, screen=True, auto_refresh=False) as live:
             while True:
                 # Calculate time difference for network rates
                 current_time = time.time()
@@ -218,20 +280,25 @@ def main():
                 # Get current system information
                 cpu_usage = get_cpu_usage_per_core()
                 memory_info = get_memory_info()
-                disk_info = get_disk_info()
                 # Fix here: use get_network_info() instead of get_net_io_counters()
                 current_net_io = get_network_info()
                 
                 # Update layout
-                layout["header"].update(generate_system_info())
                 layout["cpu"].update(generate_cpu_table(cpu_usage))
                 layout["memory"].update(generate_memory_table(memory_info))
-                layout["disk"].update(generate_disk_table(disk_info))
                 layout["network"].update(generate_network_table(prev_net_io, current_net_io, time_diff))
                 
+                # Slow-changing panels are refreshed at a lower rate
+                if tick % SLOW_REFRESH_TICKS == 0:
+                    layout["header"].update(generate_system_info())
+                    layout["disk"].update(generate_disk_table(get_disk_info()))
+                
+                live.refresh()
+                
                 # Update previous values
                 prev_net_io = current_net_io
                 prev_time = current_time
+                tick += 1
                 
                 time.sleep(1)
     except KeyboardInterrupt:
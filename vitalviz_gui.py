@@ -7,13 +7,17 @@ disk usage, and network statistics with real-time charts.
 
 import customtkinter as ctk  # Modern alternative to ttk
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import time
+import os
+import csv
+import json
 import threading
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import (
-    FigureCanvasTkAgg, NavigationToolbar2Tk
-)
+import functools
+import concurrent.futures
+import importlib.util
+from contextlib import contextmanager
+from types import SimpleNamespace
 import numpy as np
 import platform
 from datetime import datetime
@@ -25,7 +29,12 @@ from vitalviz_cli import (
     get_memory_info, 
     get_disk_info,
     get_network_info,
-    size_formatter
+    get_process_info,
+    size_formatter,
+    format_uptime,
+    BOOT_DATETIME,
+    CPU_COUNT,
+    SLOW_REFRESH_TICKS
 )
 
 # Handle optional dependencies
@@ -36,22 +45,77 @@ except ImportError:
     TOOLTIPS_AVAILABLE = False
     print("Warning: tktooltip module not found. Tooltips will be disabled.")
 
+# The tray and notification modules are only located here and imported on first use
+SYSTRAY_AVAILABLE = all(importlib.util.find_spec(name) for name in ("pystray", "PIL"))
+if not SYSTRAY_AVAILABLE:
+    print("Warning: pystray or PIL modules not found. System tray icon will be disabled.")
+
+NOTIFICATIONS_AVAILABLE = importlib.util.find_spec("plyer") is not None
+if not NOTIFICATIONS_AVAILABLE:
+    print("Warning: plyer module not found. System notifications will be disabled.")
+
 try:
-    import pystray
-    from PIL import Image, ImageDraw
-    SYSTRAY_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    SYSTRAY_AVAILABLE = False
-    print("Warning: pystray or PIL modules not found. System tray icon will be disabled.")
+    NUMBA_AVAILABLE = False
 
 try:
-    from plyer import notification
-    NOTIFICATIONS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    NOTIFICATIONS_AVAILABLE = False
-    print("Warning: plyer module not found. System notifications will be disabled.")
+    ORJSON_AVAILABLE = False
+
+# Smallest y range of the network graph, in bytes/second
+NETWORK_MIN_YLIM = 1024
+
+# Chart colors per theme, matching matplotlib's dark_background and default styles
+CHART_PALETTES = {
+    "dark": {"face": "black", "text": "white", "grid": "white"},
+    "light": {"face": "white", "text": "black", "grid": "#b0b0b0"}
+}
+
+# Process list sort options: (dict key, descending)
+PROCESS_SORT_KEYS = {
+    "CPU": ("cpu_percent", True),
+    "Memory": ("memory_percent", True),
+    "Name": ("name", False),
+    "PID": ("pid", False)
+}
 
 # Helper functions
+@functools.lru_cache(maxsize=None)
+def load_matplotlib():
+    """Import matplotlib on first use, as it is slow to import"""
+    # Figures are embedded through FigureCanvasTkAgg, so pyplot and its
+    # backend selection and figure manager are never needed
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import (
+        FigureCanvasTkAgg, NavigationToolbar2Tk
+    )
+    from matplotlib.collections import PolyCollection
+    from matplotlib.patches import Wedge
+    return SimpleNamespace(
+        Figure=Figure,
+        FigureCanvasTkAgg=FigureCanvasTkAgg,
+        NavigationToolbar2Tk=NavigationToolbar2Tk,
+        PolyCollection=PolyCollection,
+        Wedge=Wedge
+    )
+
+@functools.lru_cache(maxsize=None)
+def load_systray():
+    """Import pystray and PIL on first use, disabling the tray if they fail to import"""
+    global SYSTRAY_AVAILABLE
+    try:
+        import pystray
+        from PIL import Image, ImageDraw
+    except ImportError:
+        SYSTRAY_AVAILABLE = False
+        print("Warning: pystray or PIL modules could not be imported. System tray icon will be disabled.")
+        return None
+    return SimpleNamespace(pystray=pystray, Image=Image, ImageDraw=ImageDraw)
+
 def add_tooltip(widget, text):
     """Add tooltip to widget if tooltips are available"""
     if TOOLTIPS_AVAILABLE:
@@ -59,7 +123,14 @@ def add_tooltip(widget, text):
 
 def notify(title, message):
     """Show notification if available"""
+    global NOTIFICATIONS_AVAILABLE
     if NOTIFICATIONS_AVAILABLE:
+        try:
+            from plyer import notification
+        except ImportError:
+            NOTIFICATIONS_AVAILABLE = False
+            print("Warning: plyer module could not be imported. System notifications will be disabled.")
+            return
         notification.notify(
             title=title,
             message=message,
@@ -67,6 +138,77 @@ def notify(title, message):
             timeout=10
         )
 
+if NUMBA_AVAILABLE:
+    # Compiled eagerly for the ring buffer dtype so no JIT cost hits a tick
+    @njit("void(float32[:, :], int64, float32[:, :])", cache=True)
+    def unroll_ring(ring, head, out):
+        """Copy a wrapped (series, samples) ring buffer into out, oldest first"""
+        n = ring.shape[1]
+        for i in range(ring.shape[0]):
+            for j in range(n):
+                out[i, j] = ring[i, (head + j) % n]
+else:
+    def unroll_ring(ring, head, out):
+        """Copy a wrapped (series, samples) ring buffer into out, oldest first"""
+        tail = ring.shape[1] - head
+        out[:, :tail] = ring[:, head:]
+        out[:, tail:] = ring[:, :head]
+
+class AxesBlitter:
+    """Redraw the animated artists of one axes without re-rendering the figure"""
+    
+    def __init__(self, canvas, ax):
+        self.canvas = canvas
+        self.ax = ax
+        self.artists = []
+        self.background = None
+        self.saving = False
+        # Every full draw (first show, resize, rescale) refreshes the background
+        canvas.mpl_connect("draw_event", self.on_draw)
+    
+    def on_draw(self, event):
+        """Cache the static background and draw the artists over it"""
+        if self.saving:
+            return
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_artists()
+    
+    def draw_artists(self):
+        """Draw the animated artists onto the canvas renderer"""
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+    
+    def set_artists(self, artists):
+        """Make artists animated and schedule a full draw to recapture the background"""
+        for artist in artists:
+            artist.set_animated(True)
+        self.artists = artists
+        self.background = None
+        self.canvas.draw_idle()
+    
+    def update(self):
+        """Blit the artists onto the cached background"""
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_artists()
+        self.canvas.blit(self.ax.bbox)
+    
+    @contextmanager
+    def static_artists(self):
+        """Include the artists in normal figure draws, e.g. for savefig"""
+        self.saving = True
+        for artist in self.artists:
+            artist.set_animated(False)
+        try:
+            yield
+        finally:
+            for artist in self.artists:
+                artist.set_animated(True)
+            self.saving = False
+            self.canvas.draw_idle()
+
 class SplashScreen(ctk.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -136,6 +278,9 @@ class SystemMonitorGUI:
         self.update_interval = 1
         self.max_history = 60
         self.enable_notifications = True
+        self.draw_skip = 3  # Redraw graphs and gauges every N ticks
+        self.max_redraw_rate = 30  # Never redraw charts more often than this per second
+        self.slow_interval = 10.0  # Refresh disks and uptime every N seconds
         
         # Set theme
         ctk.set_appearance_mode("dark")
@@ -160,22 +305,39 @@ class SystemMonitorGUI:
         }
         self.current_theme = "dark"  # Default theme
         
+        # Prime the CPU counters so the first non-blocking sample is meaningful
+        psutil.cpu_percent(percpu=True, interval=None)
+        
         # Data storage for historical plotting
-        self.cpu_history = [[] for _ in range(len(get_cpu_usage_per_core()))]
-        self.memory_history = []
-        self.network_recv_history = []
-        self.network_sent_history = []
-        self.time_points = []
+        self.init_history()
         
         # Track network stats for calculating rates
-        self.prev_net_io = psutil.net_io_counters()
-        self.prev_time = time.time()
+        self.prev_net_io = get_network_info()
+        self.prev_time = time.monotonic()
+        
+        # Last rendered values, used to skip redundant widget updates
+        self.last_cpu_values = [None] * CPU_COUNT
+        self.last_memory_sig = None
+        self.last_memory_percent = None
+        self.last_disk_sig = None
+        self.last_network_sig = None
+        self.last_dashboard_sig = None
+        self.last_uptime = None
+        self.last_slow = float("-inf")  # Time of the last disk/uptime refresh
+        
+        # Whether a high-usage alert is active, so each spike notifies once
+        self.cpu_notified = False
+        self.memory_notified = False
+        
+        # Charts are created after the window is shown
+        self.charts_ready = False
+        self.gauge_values = (0.0, 0.0)  # Average CPU %, memory %
         
         # Create header with system info
         self.create_header()
         
         # Create tabbed interface
-        self.tab_control = ctk.CTkTabview(self.root)
+        self.tab_control = ctk.CTkTabview(self.root, command=self.on_tab_change)
         self.tab_control.pack(expand=1, fill="both")
         
         # Dashboard Tab
@@ -202,17 +364,75 @@ class SystemMonitorGUI:
         self.processes_tab = self.tab_control.add("Processes")
         self.create_processes_tab()
         
-        # Start monitoring
-        self.running = True
-        self.update_thread = threading.Thread(target=self.update_data)
-        self.update_thread.daemon = True
-        self.update_thread.start()
-        
-        # Create system tray icon
-        self.create_system_tray()
-        
         # Create menubar
         self.create_menubar()
+        
+        # Disk and process collection can block, so it runs off the Tk thread
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="vv-samp")
+        self.disk_future = None
+        self.process_future = None
+        
+        # Start monitoring on the Tk event loop
+        self.tick = 0
+        self.next_deadline = time.monotonic()
+        self.skip_redraw = False
+        self.redraw_job = None
+        self.last_redraw = float("-inf")
+        
+        # Skip widget and chart updates while the window is iconified or in the tray
+        self.visible = True
+        self.modal_open = False  # Charts are not redrawn behind a modal dialog
+        self.root.bind("<Map>", self.on_visibility_change, add="+")
+        self.root.bind("<Unmap>", self.on_visibility_change, add="+")
+        self.update_job = self.root.after(0, self.update_data)
+        
+        # Defer matplotlib and the tray icon so the window appears before they are imported
+        self.root.after(100, self.create_charts)
+        self.tray_icon = None  # Set once the tray icon has been created
+        self.root.after(200, self.create_system_tray)
+    
+    def init_history(self):
+        """Allocate ring buffers holding max_history samples per series"""
+        self.cpu_history = np.zeros((CPU_COUNT, self.max_history), dtype=np.float32)
+        self.cpu_unrolled = np.empty_like(self.cpu_history)
+        self.memory_history = np.zeros(self.max_history, dtype=np.float32)
+        self.network_recv_history = np.zeros(self.max_history, dtype=np.float32)
+        self.network_sent_history = np.zeros(self.max_history, dtype=np.float32)
+        self.time_points = np.zeros(self.max_history, dtype=np.float64)  # Unix timestamps
+        self.history_head = 0  # Slot the next sample is written to
+        self.history_len = 0   # Number of valid samples
+        self.x_axis = np.arange(self.max_history, dtype=np.float32)  # Shared x values for every chart
+    
+    def clear_history(self):
+        """Empty the ring buffers in place"""
+        for ring in (self.cpu_history, self.memory_history, self.network_recv_history,
+                     self.network_sent_history, self.time_points):
+            ring.fill(0)
+        self.history_head = 0
+        self.history_len = 0
+    
+    def record_history(self, timestamp, cpu_usage, memory_percent, bytes_sent_per_sec, bytes_recv_per_sec):
+        """Write one sample of every series into the ring buffers"""
+        head = self.history_head
+        self.time_points[head] = timestamp
+        self.cpu_history[:, head] = cpu_usage
+        self.memory_history[head] = memory_percent
+        self.network_sent_history[head] = bytes_sent_per_sec
+        self.network_recv_history[head] = bytes_recv_per_sec
+        self.history_head = (head + 1) % self.max_history
+        self.history_len = min(self.history_len + 1, self.max_history)
+    
+    def ordered_history(self, ring):
+        """Return the valid samples of a ring buffer, oldest first"""
+        if self.history_len < self.max_history:
+            return ring[..., :self.history_len]
+        head = self.history_head
+        return np.concatenate((ring[..., head:], ring[..., :head]), axis=-1)
+    
+    def exported_history(self, ring):
+        """Return the samples of a ring buffer as a list of floats rounded for export"""
+        # float32 samples widen to values like 45.29999923706055 without rounding
+        return np.round(self.ordered_history(ring).astype(np.float64), 2).tolist()
     
     def create_header(self):
         """Create header with system information"""
@@ -237,13 +457,11 @@ class SystemMonitorGUI:
         
         # System info
         uname = platform.uname()
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
-        
         system_label = ctk.CTkLabel(
             header_frame, 
             text=f"System: {uname.system} {uname.release} | "
                  f"Processor: {uname.processor} | "
-                 f"Boot Time: {boot_time.strftime('%Y-%m-%d %H:%M:%S')}",
+                 f"Boot Time: {BOOT_DATETIME.strftime('%Y-%m-%d %H:%M:%S')}",
             font=("Arial", 10)
         )
         system_label.pack(anchor="w", padx=10)
@@ -262,7 +480,7 @@ class SystemMonitorGUI:
         cpu_overview = ctk.CTkFrame(self.cpu_tab)
         cpu_overview.pack(fill="x", padx=10, pady=10)
         
-        cpu_count = psutil.cpu_count(logical=True)
+        cpu_count = CPU_COUNT
         physical_cores = psutil.cpu_count(logical=False)
         
         ctk.CTkLabel(
@@ -289,18 +507,6 @@ class SystemMonitorGUI:
             
             self.cpu_bars.append(progressbar)
             self.cpu_labels.append(label)
-        
-        # CPU history graph
-        self.cpu_fig = plt.Figure(figsize=(8, 4), dpi=100)
-        self.cpu_subplot = self.cpu_fig.add_subplot(111)
-        self.cpu_canvas = FigureCanvasTkAgg(self.cpu_fig, self.cpu_tab)
-        self.cpu_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # CPU toolbar for graph navigation
-        self.cpu_toolbar_frame = ttk.Frame(self.cpu_tab)
-        self.cpu_toolbar_frame.pack(fill="x")
-        self.cpu_toolbar = NavigationToolbar2Tk(self.cpu_canvas, self.cpu_toolbar_frame)
-        self.cpu_toolbar.update()
     
     def create_memory_tab(self):
         """Create memory monitoring tab"""
@@ -316,7 +522,8 @@ class SystemMonitorGUI:
         
         # Create labels for memory info
         ctk.CTkLabel(details_frame, text="Total Memory:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.total_mem_label = ctk.CTkLabel(details_frame, text=size_formatter(mem_info["total"]))
+        self.memory_total = mem_info["total"]
+        self.total_mem_label = ctk.CTkLabel(details_frame, text=size_formatter(self.memory_total))
         self.total_mem_label.grid(row=0, column=1, sticky="w", padx=5, pady=2)
         
         ctk.CTkLabel(details_frame, text="Available:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", padx=5, pady=2)
@@ -342,12 +549,6 @@ class SystemMonitorGUI:
         
         # Add tooltip to memory usage bar
         add_tooltip(self.memory_bar, "Current RAM usage percentage")
-        
-        # Memory history graph
-        self.memory_fig = plt.Figure(figsize=(8, 4), dpi=100)
-        self.memory_subplot = self.memory_fig.add_subplot(111)
-        self.memory_canvas = FigureCanvasTkAgg(self.memory_fig, self.memory_tab)
-        self.memory_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
     
     def create_disk_tab(self):
         """Create disk monitoring tab"""
@@ -357,6 +558,8 @@ class SystemMonitorGUI:
         # Create regular ttk Treeview for disk info
         columns = ("Device", "Mount", "Type", "Total", "Used", "Free", "Usage")
         self.disk_tree = ttk.Treeview(disk_frame, columns=columns, show="headings")
+        # (device, mountpoint) -> (item id, displayed values)
+        self.disk_items = {}
         
         for col in columns:
             self.disk_tree.heading(col, text=col)
@@ -397,12 +600,160 @@ class SystemMonitorGUI:
         ctk.CTkLabel(stats_frame, text="Receive Rate:", font=("Arial", 10, "bold")).grid(row=1, column=2, sticky="w", padx=5, pady=2)
         self.bytes_recv_rate_label = ctk.CTkLabel(stats_frame, text="0 B/s")
         self.bytes_recv_rate_label.grid(row=1, column=3, sticky="w", padx=5, pady=2)
+    
+    def create_charts(self):
+        """Create all matplotlib charts"""
+        self.create_dashboard_charts()
+        self.create_cpu_chart()
+        self.create_memory_chart()
+        self.create_network_chart()
+        self.charts_ready = True
+        self.toggle_cpu_toolbar()
+        self.update_plots()
+    
+    def create_dashboard_charts(self):
+        """Create dashboard CPU and memory gauges"""
+        mpl = load_matplotlib()
+        
+        self.cpu_fig_gauge = mpl.Figure(figsize=(3, 3), dpi=100)
+        self.cpu_subplot_gauge = self.cpu_fig_gauge.add_subplot(111)
+        self.cpu_canvas_gauge = mpl.FigureCanvasTkAgg(self.cpu_fig_gauge, self.cpu_gauge_frame)
+        self.cpu_canvas_gauge.get_tk_widget().pack(fill="both", expand=True)
+        self.cpu_gauge_blitter = AxesBlitter(self.cpu_canvas_gauge, self.cpu_subplot_gauge)
+        
+        self.memory_fig_gauge = mpl.Figure(figsize=(3, 3), dpi=100)
+        self.memory_subplot_gauge = self.memory_fig_gauge.add_subplot(111)
+        self.memory_canvas_gauge = mpl.FigureCanvasTkAgg(self.memory_fig_gauge, self.memory_gauge_frame)
+        self.memory_canvas_gauge.get_tk_widget().pack(fill="both", expand=True)
+        self.memory_gauge_blitter = AxesBlitter(self.memory_canvas_gauge, self.memory_subplot_gauge)
+        self.init_gauges()
+    
+    def create_cpu_chart(self):
+        """Create CPU history graph"""
+        mpl = load_matplotlib()
+        
+        self.cpu_fig = mpl.Figure(figsize=(8, 4), dpi=100)
+        self.cpu_subplot = self.cpu_fig.add_subplot(111)
+        self.cpu_canvas = mpl.FigureCanvasTkAgg(self.cpu_fig, self.cpu_tab)
+        self.cpu_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.cpu_blitter = AxesBlitter(self.cpu_canvas, self.cpu_subplot)
+        self.init_cpu_plot()
+        
+        # The navigation toolbar is only built when enabled from the View menu
+        self.cpu_toolbar_frame = ttk.Frame(self.cpu_tab)
+        self.cpu_toolbar = None
+    
+    def create_memory_chart(self):
+        """Create memory history graph"""
+        mpl = load_matplotlib()
+        
+        self.memory_fig = mpl.Figure(figsize=(8, 4), dpi=100)
+        self.memory_subplot = self.memory_fig.add_subplot(111)
+        self.memory_canvas = mpl.FigureCanvasTkAgg(self.memory_fig, self.memory_tab)
+        self.memory_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.memory_blitter = AxesBlitter(self.memory_canvas, self.memory_subplot)
+        self.init_memory_plot()
+    
+    def create_network_chart(self):
+        """Create network history graph"""
+        mpl = load_matplotlib()
         
-        # Network history graph
-        self.network_fig = plt.Figure(figsize=(8, 4), dpi=100)
+        self.network_fig = mpl.Figure(figsize=(8, 4), dpi=100)
         self.network_subplot = self.network_fig.add_subplot(111)
-        self.network_canvas = FigureCanvasTkAgg(self.network_fig, self.network_tab)
+        self.network_canvas = mpl.FigureCanvasTkAgg(self.network_fig, self.network_tab)
         self.network_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
+        self.network_blitter = AxesBlitter(self.network_canvas, self.network_subplot)
+        self.init_network_plot()
+    
+    def init_plots(self):
+        """(Re)create the persistent artists of all charts"""
+        if not self.charts_ready:
+            return
+        self.init_gauges()
+        self.init_cpu_plot()
+        self.init_memory_plot()
+        self.init_network_plot()
+    
+    def init_gauges(self):
+        """Set up the dashboard gauges with persistent value wedges"""
+        self.cpu_gauge_wedge = self.init_gauge(self.cpu_subplot_gauge, self.cpu_gauge_blitter)
+        self.memory_gauge_wedge = self.init_gauge(self.memory_subplot_gauge, self.memory_gauge_blitter)
+    
+    def init_gauge(self, subplot, blitter):
+        """Draw a gauge's background ring and return the wedge showing its value"""
+        Wedge = load_matplotlib().Wedge
+        subplot.clear()
+        
+        # Background ring (gray)
+        subplot.add_patch(Wedge((0, 0), 1, 0, 360, width=0.3, color='gray', alpha=0.3))
+        
+        # Foreground ring, filled clockwise from the top as the value grows
+        wedge = Wedge((0, 0), 1, 90, 90, width=0.3, color='green')
+        subplot.add_patch(wedge)
+        
+        subplot.set_xlim(-1.1, 1.1)
+        subplot.set_ylim(-1.1, 1.1)
+        subplot.set_aspect("equal")
+        subplot.set_axis_off()
+        
+        blitter.set_artists([wedge])
+        return wedge
+    
+    def init_cpu_plot(self):
+        """Set up CPU history axes with one persistent line per core"""
+        self.cpu_subplot.clear()
+        self.cpu_lines = [
+            self.cpu_subplot.plot([], [], label=f"Core {i}")[0]
+            for i in range(CPU_COUNT)
+        ]
+        
+        self.cpu_subplot.set_xlim(0, self.max_history - 1)
+        self.cpu_subplot.set_ylim(0, 100)
+        self.cpu_subplot.set_title("CPU Usage History")
+        self.cpu_subplot.set_ylabel("Usage %")
+        self.cpu_subplot.set_xlabel("Time (seconds ago)")
+        self.cpu_subplot.grid(True)
+        
+        # Only show legend if we have few cores
+        if CPU_COUNT <= 8:
+            self.cpu_subplot.legend(loc="upper left")
+        
+        self.cpu_fig.tight_layout()
+        self.cpu_blitter.set_artists(self.cpu_lines)
+    
+    def init_memory_plot(self):
+        """Set up memory history axes with a persistent line and filled area"""
+        self.memory_subplot.clear()
+        self.memory_line, = self.memory_subplot.plot([], [], 'b-')
+        self.memory_fill = load_matplotlib().PolyCollection([], facecolor="C0", alpha=0.3)
+        self.memory_subplot.add_collection(self.memory_fill)
+        
+        self.memory_subplot.set_xlim(0, self.max_history - 1)
+        self.memory_subplot.set_ylim(0, 100)
+        self.memory_subplot.set_title("Memory Usage History")
+        self.memory_subplot.set_ylabel("Usage %")
+        self.memory_subplot.set_xlabel("Time (seconds ago)")
+        self.memory_subplot.grid(True)
+        
+        self.memory_fig.tight_layout()
+        self.memory_blitter.set_artists([self.memory_fill, self.memory_line])
+    
+    def init_network_plot(self):
+        """Set up network history axes with persistent sent/received lines"""
+        self.network_subplot.clear()
+        self.network_sent_line, = self.network_subplot.plot([], [], 'r-', label='Sent')
+        self.network_recv_line, = self.network_subplot.plot([], [], 'g-', label='Received')
+        
+        self.network_subplot.set_xlim(0, self.max_history - 1)
+        self.network_subplot.set_ylim(0, NETWORK_MIN_YLIM)
+        self.network_subplot.set_title("Network Traffic History")
+        self.network_subplot.set_ylabel("Bytes/second")
+        self.network_subplot.set_xlabel("Time (seconds ago)")
+        self.network_subplot.grid(True)
+        self.network_subplot.legend(loc="upper left")
+        
+        self.network_fig.tight_layout()
+        self.network_blitter.set_artists([self.network_sent_line, self.network_recv_line])
     
     def create_processes_tab(self):
         """Create process monitoring tab"""
@@ -416,8 +767,9 @@ class SystemMonitorGUI:
         ttk.Label(controls_frame, text="Sort by:").pack(side="left", padx=5)
         self.sort_var = tk.StringVar(value="CPU")
         sort_options = ttk.Combobox(controls_frame, textvariable=self.sort_var, 
-                                  values=["CPU", "Memory", "Name", "PID"], width=10)
+                                  values=list(PROCESS_SORT_KEYS), width=10, state="readonly")
         sort_options.pack(side="left", padx=5)
+        sort_options.bind("<<ComboboxSelected>>", self.filter_processes)
         
         self.search_var = tk.StringVar()
         self.search_var.trace("w", self.filter_processes)
@@ -434,6 +786,9 @@ class SystemMonitorGUI:
             self.process_tree.column(col, width=width)
         
         self.process_tree.pack(fill="both", expand=True)
+        self.processes = []
+        self.process_items = {}  # pid -> (iid, values)
+        self.filter_job = None
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(process_frame, orient="vertical", command=self.process_tree.yview)
@@ -468,11 +823,6 @@ class SystemMonitorGUI:
         self.cpu_gauge_frame = ctk.CTkFrame(cpu_panel)
         self.cpu_gauge_frame.pack(fill="both", expand=True)
         
-        self.cpu_fig_gauge = plt.Figure(figsize=(3, 3), dpi=100)
-        self.cpu_subplot_gauge = self.cpu_fig_gauge.add_subplot(111, polar=True)
-        self.cpu_canvas_gauge = FigureCanvasTkAgg(self.cpu_fig_gauge, self.cpu_gauge_frame)
-        self.cpu_canvas_gauge.get_tk_widget().pack(fill="both", expand=True)
-        
         self.cpu_value_label = ctk.CTkLabel(cpu_panel, text="0%", font=("Arial", 20))
         self.cpu_value_label.pack(pady=5)
         
@@ -486,11 +836,6 @@ class SystemMonitorGUI:
         self.memory_gauge_frame = ctk.CTkFrame(memory_panel)
         self.memory_gauge_frame.pack(fill="both", expand=True)
         
-        self.memory_fig_gauge = plt.Figure(figsize=(3, 3), dpi=100)
-        self.memory_subplot_gauge = self.memory_fig_gauge.add_subplot(111, polar=True)
-        self.memory_canvas_gauge = FigureCanvasTkAgg(self.memory_fig_gauge, self.memory_gauge_frame)
-        self.memory_canvas_gauge.get_tk_widget().pack(fill="both", expand=True)
-        
         self.memory_value_label = ctk.CTkLabel(memory_panel, text="0%", font=("Arial", 20))
         self.memory_value_label.pack(pady=5)
         
@@ -521,22 +866,31 @@ class SystemMonitorGUI:
         """Create system tray icon if available"""
         if not SYSTRAY_AVAILABLE:
             return
+        tray = load_systray()
+        if tray is None:
+            return
         
         # Create icon image
         icon_size = 64
-        image = Image.new('RGB', (icon_size, icon_size), color=(0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        image = tray.Image.new('RGB', (icon_size, icon_size), color=(0, 0, 0))
+        draw = tray.ImageDraw.Draw(image)
         
         # Draw a simple CPU icon
         draw.rectangle([10, 10, 54, 54], fill="#4c78db", outline="white", width=2)
         
         # Create icon menu
         menu = (
-            pystray.MenuItem('Show', self.show_window),
-            pystray.MenuItem('Exit', self.exit_app)
+            tray.pystray.MenuItem('Show', self.show_window),
+            tray.pystray.MenuItem('Exit', self.exit_app)
         )
         
-        self.tray_icon = pystray.Icon("vitalviz", image, "VitalViz", menu)
+        self.tray_icon = tray.pystray.Icon("vitalviz", image, "VitalViz", menu)
+        
+        # Run the icon loop once for the app's lifetime; the icon stays hidden
+        # until the window is minimized to the tray
+        self.tray_thread = threading.Thread(
+            target=self.tray_icon.run, kwargs={"setup": lambda icon: None}, daemon=True)
+        self.tray_thread.start()
     
     def create_menubar(self):
         """Create application menubar"""
@@ -558,6 +912,9 @@ class SystemMonitorGUI:
         self.always_on_top = tk.BooleanVar(value=False)
         view_menu.add_checkbutton(label="Always On Top", variable=self.always_on_top,
                                   command=self.toggle_always_on_top)
+        self.show_cpu_toolbar = tk.BooleanVar(value=False)
+        view_menu.add_checkbutton(label="Show CPU Graph Toolbar", variable=self.show_cpu_toolbar,
+                                  command=self.toggle_cpu_toolbar)
         view_menu.add_separator()
         view_menu.add_command(label="Reset Graphs", command=self.reset_graphs)
         
@@ -567,143 +924,210 @@ class SystemMonitorGUI:
         help_menu.add_command(label="About", command=self.show_about)
     
     def update_data(self):
-        """Update all monitoring data in a separate thread"""
-        MAX_HISTORY = 60  # Keep 60 data points (1 minute at 1 second intervals)
-        
-        while self.running:
-            try:
-                # Calculate time difference for network rates
-                current_time = time.time()
-                time_diff = current_time - self.prev_time
-                
-                # Get current system info
-                cpu_usage = get_cpu_usage_per_core()
-                memory_info = get_memory_info()
-                disk_info = get_disk_info()
-                current_net_io = get_network_info()
-                
-                # Update time points for graphs
-                if len(self.time_points) >= MAX_HISTORY:
-                    self.time_points.pop(0)
-                self.time_points.append(datetime.now().strftime("%H:%M:%S"))
-                
-                # Update CPU history
-                for i, usage in enumerate(cpu_usage):
-                    if len(self.cpu_history[i]) >= MAX_HISTORY:
-                        self.cpu_history[i].pop(0)
-                    self.cpu_history[i].append(usage)
-                
-                # Update memory history
-                if len(self.memory_history) >= MAX_HISTORY:
-                    self.memory_history.pop(0)
-                self.memory_history.append(memory_info["percent"])
-                
-                # Calculate network rates
-                bytes_sent_per_sec = (current_net_io.bytes_sent - self.prev_net_io.bytes_sent) / time_diff
-                bytes_recv_per_sec = (current_net_io.bytes_recv - self.prev_net_io.bytes_recv) / time_diff
-                
-                # Update network history
-                if len(self.network_sent_history) >= MAX_HISTORY:
-                    self.network_sent_history.pop(0)
-                    self.network_recv_history.pop(0)
+        """Sample monitoring data, update the UI and schedule the next tick"""
+        try:
+            # Calculate time difference for network rates; the monotonic
+            # clock is immune to wall-clock jumps such as NTP corrections
+            current_time = time.monotonic()
+            time_diff = current_time - self.prev_time
+            
+            # Get current system info
+            cpu_usage = get_cpu_usage_per_core()
+            memory_info = get_memory_info()
+            current_net_io = get_network_info()
+            
+            # Convert once so the history write and the average are vectorized
+            cpu_array = np.asarray(cpu_usage, dtype=np.float32)
+            avg_cpu = float(cpu_array.mean())
+            
+            # Calculate network rates
+            prev_net_io = self.prev_net_io
+            bytes_sent_per_sec = (current_net_io.bytes_sent - prev_net_io.bytes_sent) / time_diff
+            bytes_recv_per_sec = (current_net_io.bytes_recv - prev_net_io.bytes_recv) / time_diff
+            
+            # Update CPU, memory and network history
+            self.record_history(time.time(), cpu_array, memory_info["percent"],
+                                bytes_sent_per_sec, bytes_recv_per_sec)
+            
+            # While the window is hidden only history and alerts are kept up to date
+            if self.visible:
+                self.update_ui_cpu(cpu_usage)
+                self.update_ui_memory(memory_info)
+                self.update_ui_network(current_net_io, bytes_sent_per_sec, bytes_recv_per_sec)
+                self.update_dashboard(avg_cpu, memory_info, bytes_sent_per_sec, bytes_recv_per_sec)
                 
-                self.network_sent_history.append(bytes_sent_per_sec)
-                self.network_recv_history.append(bytes_recv_per_sec)
+                # Charts are expensive to draw, so refresh them less often and
+                # only on the visible tab; history keeps accumulating regardless
+                if self.skip_redraw:
+                    self.skip_redraw = False
+                elif self.tick % self.draw_skip == 0:
+                    self.request_redraw()
                 
-                # Schedule GUI updates
-                self.root.after(0, self.update_ui_cpu, cpu_usage)
-                self.root.after(0, self.update_ui_memory, memory_info)
-                self.root.after(0, self.update_ui_disk, disk_info)
-                self.root.after(0, self.update_ui_network, current_net_io, bytes_sent_per_sec, bytes_recv_per_sec)
-                self.root.after(0, self.update_ui_system_info)
-                self.root.after(0, self.update_dashboard, cpu_usage, memory_info, current_net_io, bytes_sent_per_sec, bytes_recv_per_sec)
+                # Disk usage and uptime change slowly, so refresh them on their own clock
+                if current_time - self.last_slow >= self.slow_interval:
+                    if self.disk_future is None:
+                        self.disk_future = self.pool.submit(get_disk_info)
+                    self.update_ui_system_info()
+                    self.last_slow = current_time
                 
-                # Check thresholds for notifications
-                if NOTIFICATIONS_AVAILABLE and self.enable_notifications:
-                    self.check_thresholds(cpu_usage, memory_info)
+                # Walking every process is costly, so only do it while the list is shown
+                if self.tick % SLOW_REFRESH_TICKS == 0 and self.tab_control.get() == "Processes":
+                    self.request_processes()
                 
-                # Update previous values
-                self.prev_net_io = current_net_io
-                self.prev_time = current_time
+                # Apply background results once they are ready
+                if self.disk_future is not None and self.disk_future.done():
+                    future, self.disk_future = self.disk_future, None
+                    self.update_ui_disk(future.result())
+                if self.process_future is not None and self.process_future.done():
+                    future, self.process_future = self.process_future, None
+                    self.update_ui_processes(future.result())
             
-            except Exception as e:
-                print(f"Error in update thread: {e}")
+            # Check thresholds for notifications
+            if NOTIFICATIONS_AVAILABLE and self.enable_notifications:
+                self.check_thresholds(avg_cpu, memory_info)
             
-            time.sleep(self.update_interval)
+            # Update previous values
+            self.prev_net_io = current_net_io
+            self.prev_time = current_time
+            self.tick += 1
+        
+        except Exception as e:
+            print(f"Error in update loop: {e}")
+        
+        # Schedule against fixed deadlines so time spent in a tick doesn't accumulate as drift
+        self.next_deadline += self.update_interval
+        delay = self.next_deadline - time.monotonic()
+        if delay < 0:
+            # Overran the interval: resync rather than firing catch-up ticks,
+            # and skip the next redraw to shed load
+            self.next_deadline = time.monotonic()
+            self.skip_redraw = True
+            delay = 0
+        self.update_job = self.root.after(int(delay * 1000), self.update_data)
     
     def update_ui_cpu(self, cpu_usage):
         """Update CPU UI elements"""
-        # Update progress bars
-        for i, usage in enumerate(cpu_usage):
-            if i < len(self.cpu_bars):
-                self.cpu_bars[i].set(usage / 100)  # Convert percentage to 0-1 range
-                self.cpu_labels[i].configure(text=f"Core {i}: {usage:.1f}%")
-        
-        # Update graph
-        if hasattr(self, 'cpu_subplot') and hasattr(self, 'cpu_canvas'):
-            self.cpu_subplot.clear()
-            
-            # Plot each CPU core
-            for i, history in enumerate(self.cpu_history):
-                if history:  # Only plot if we have data
-                    self.cpu_subplot.plot(range(len(history)), history, label=f"Core {i}")
-            
-            self.cpu_subplot.set_ylim(0, 100)
-            self.cpu_subplot.set_title("CPU Usage History")
-            self.cpu_subplot.set_ylabel("Usage %")
-            self.cpu_subplot.set_xlabel("Time (seconds ago)")
-            self.cpu_subplot.grid(True)
-            
-            # Only show legend if we have few cores
-            if len(self.cpu_history) <= 8:
-                self.cpu_subplot.legend(loc="upper left")
-                
-            self.cpu_fig.tight_layout()
-            self.cpu_canvas.draw()
+        # Update progress bars, skipping cores whose displayed value is unchanged
+        last_values = self.last_cpu_values
+        for i, (usage, bar, label) in enumerate(zip(cpu_usage, self.cpu_bars, self.cpu_labels)):
+            usage = round(usage, 1)
+            if usage == last_values[i]:
+                continue
+            last_values[i] = usage
+            bar.set(usage / 100)  # Convert percentage to 0-1 range
+            label.configure(text=f"Core {i}: {usage:.1f}%")
+    
+    def update_plots(self):
+        """Redraw all charts"""
+        if not self.charts_ready:
+            return
+        self.update_gauges()
+        self.update_cpu_plot()
+        self.update_memory_plot()
+        self.update_network_plot()
+    
+    def redraw_tab(self, tab_name):
+        """Redraw the charts shown on the given tab"""
+        if not self.charts_ready:
+            return
+        if tab_name == "Dashboard":
+            self.update_gauges()
+        elif tab_name == "CPU":
+            self.update_cpu_plot()
+        elif tab_name == "Memory":
+            self.update_memory_plot()
+        elif tab_name == "Network":
+            self.update_network_plot()
+    
+    def request_redraw(self):
+        """Schedule a redraw of the visible charts, coalescing bursts of requests"""
+        if self.redraw_job is not None or self.modal_open:
+            return
+        wait = self.last_redraw + 1 / self.max_redraw_rate - time.monotonic()
+        self.redraw_job = self.root.after(max(0, int(wait * 1000)), self.flush_redraw)
+    
+    def flush_redraw(self):
+        """Redraw the charts on the visible tab"""
+        self.redraw_job = None
+        self.last_redraw = time.monotonic()
+        self.redraw_tab(self.tab_control.get())
+    
+    def on_tab_change(self):
+        """Bring the charts of a newly selected tab up to date"""
+        tab_name = self.tab_control.get()
+        if tab_name == "Processes":
+            self.request_processes()
+        self.request_redraw()
+    
+    def update_cpu_plot(self):
+        """Redraw the CPU history graph"""
+        if self.history_len < self.max_history:
+            cpu_data = self.cpu_history[:, :self.history_len]
+        else:
+            unroll_ring(self.cpu_history, self.history_head, self.cpu_unrolled)
+            cpu_data = self.cpu_unrolled
+        
+        x = self.x_axis[:self.history_len]
+        for line, history in zip(self.cpu_lines, cpu_data):
+            line.set_data(x, history)
+        
+        self.cpu_blitter.update()
     
     def update_ui_memory(self, memory_info):
         """Update Memory UI elements"""
+        sig = (memory_info["percent"], memory_info["used"],
+               memory_info["available"], memory_info["free"])
+        if sig == self.last_memory_sig:
+            return
+        self.last_memory_sig = sig
+        
         # Update memory info labels
-        if hasattr(self, 'total_mem_label'):
-            self.total_mem_label.configure(text=size_formatter(memory_info["total"]))
-        if hasattr(self, 'avail_mem_label'):
-            self.avail_mem_label.configure(text=size_formatter(memory_info["available"]))
-        if hasattr(self, 'used_mem_label'):
-            self.used_mem_label.configure(text=size_formatter(memory_info["used"]))
-        if hasattr(self, 'free_mem_label'):
-            self.free_mem_label.configure(text=size_formatter(memory_info["free"]))
+        if memory_info["total"] != self.memory_total:
+            self.memory_total = memory_info["total"]
+            self.total_mem_label.configure(text=size_formatter(self.memory_total))
+        self.avail_mem_label.configure(text=size_formatter(memory_info["available"]))
+        self.used_mem_label.configure(text=size_formatter(memory_info["used"]))
+        self.free_mem_label.configure(text=size_formatter(memory_info["free"]))
         
         # Update progress bar - use 0-1 range for CTkProgressBar
-        if hasattr(self, 'memory_bar'):
-            self.memory_bar.set(memory_info["percent"] / 100)
-        if hasattr(self, 'memory_percent_label'):
-            self.memory_percent_label.configure(text=f"{memory_info['percent']:.1f}%")
-        
-        # Update graph
-        if hasattr(self, 'memory_subplot') and hasattr(self, 'memory_canvas'):
-            self.memory_subplot.clear()
-            if self.memory_history:
-                x = range(len(self.memory_history))
-                self.memory_subplot.plot(x, self.memory_history, 'b-')
-                self.memory_subplot.fill_between(x, self.memory_history, alpha=0.3)
-                
-            self.memory_subplot.set_ylim(0, 100)
-            self.memory_subplot.set_title("Memory Usage History")
-            self.memory_subplot.set_ylabel("Usage %")
-            self.memory_subplot.set_xlabel("Time (seconds ago)")
-            self.memory_subplot.grid(True)
+        if memory_info["percent"] == self.last_memory_percent:
+            return
+        self.last_memory_percent = memory_info["percent"]
+        self.memory_bar.set(memory_info["percent"] / 100)
+        self.memory_percent_label.configure(text=f"{memory_info['percent']:.1f}%")
+    
+    def update_memory_plot(self):
+        """Redraw the memory history graph"""
+        if self.history_len:
+            x = self.x_axis[:self.history_len]
+            memory_history = self.ordered_history(self.memory_history)
+            self.memory_line.set_data(x, memory_history)
             
-            self.memory_fig.tight_layout()
-            self.memory_canvas.draw()
+            # Polygon enclosing the area under the line
+            self.memory_fill.set_verts([np.column_stack((
+                np.r_[x[0], x, x[-1]], np.r_[0, memory_history, 0]
+            ))])
+        else:
+            # History was reset
+            self.memory_line.set_data([], [])
+            self.memory_fill.set_verts([])
+        
+        self.memory_blitter.update()
     
     def update_ui_disk(self, disk_info):
         """Update Disk UI elements"""
-        # Clear existing data
-        for item in self.disk_tree.get_children():
-            self.disk_tree.delete(item)
+        sig = tuple((disk["device"], disk["mountpoint"], disk["used"], disk["total"])
+                    for disk in disk_info)
+        if sig == self.last_disk_sig:
+            return
+        self.last_disk_sig = sig
+        
+        seen = set()
         
-        # Add disk info rows
+        # Update changed rows in place and add new partitions
         for disk in disk_info:
+            key = (disk["device"], disk["mountpoint"])
+            seen.add(key)
             values = (
                 disk["device"],
                 disk["mountpoint"],
@@ -713,74 +1137,88 @@ class SystemMonitorGUI:
                 size_formatter(disk["free"]),
                 f"{disk['percent']:.1f}%"
             )
-            self.disk_tree.insert("", "end", values=values)
+            
+            if key in self.disk_items:
+                iid, old_values = self.disk_items[key]
+                if values == old_values:
+                    continue
+                self.disk_tree.item(iid, values=values)
+            else:
+                iid = self.disk_tree.insert("", "end", values=values)
+            self.disk_items[key] = (iid, values)
+        
+        # Drop partitions that are no longer mounted
+        for key in list(self.disk_items):
+            if key not in seen:
+                iid, _ = self.disk_items.pop(key)
+                self.disk_tree.delete(iid)
     
     def update_ui_network(self, net_io, bytes_sent_per_sec, bytes_recv_per_sec):
         """Update Network UI elements"""
+        bytes_sent, bytes_recv = net_io.bytes_sent, net_io.bytes_recv
+        sig = (bytes_sent, bytes_recv, bytes_sent_per_sec, bytes_recv_per_sec)
+        if sig == self.last_network_sig:
+            return
+        self.last_network_sig = sig
+        
         # Update network labels
-        if hasattr(self, 'bytes_sent_label'):
-            self.bytes_sent_label.configure(text=size_formatter(net_io.bytes_sent))
-        if hasattr(self, 'bytes_recv_label'):
-            self.bytes_recv_label.configure(text=size_formatter(net_io.bytes_recv))
-        if hasattr(self, 'bytes_sent_rate_label'):
-            self.bytes_sent_rate_label.configure(text=f"{size_formatter(bytes_sent_per_sec)}/s")
-        if hasattr(self, 'bytes_recv_rate_label'):
-            self.bytes_recv_rate_label.configure(text=f"{size_formatter(bytes_recv_per_sec)}/s")
-        
-        # Update graph
-        if hasattr(self, 'network_subplot') and hasattr(self, 'network_canvas'):
-            self.network_subplot.clear()
-            if self.network_sent_history and self.network_recv_history:
-                x = range(len(self.network_sent_history))
-                
-                # Plot sent and received data
-                self.network_subplot.plot(x, self.network_sent_history, 'r-', label='Sent')
-                self.network_subplot.plot(x, self.network_recv_history, 'g-', label='Received')
-                
-            self.network_subplot.set_title("Network Traffic History")
-            self.network_subplot.set_ylabel("Bytes/second")
-            self.network_subplot.set_xlabel("Time (seconds ago)")
-            self.network_subplot.grid(True)
-            self.network_subplot.legend(loc="upper left")
-            
-            self.network_fig.tight_layout()
-            self.network_canvas.draw()
+        self.bytes_sent_label.configure(text=size_formatter(bytes_sent))
+        self.bytes_recv_label.configure(text=size_formatter(bytes_recv))
+        self.bytes_sent_rate_label.configure(text=f"{size_formatter(bytes_sent_per_sec)}/s")
+        self.bytes_recv_rate_label.configure(text=f"{size_formatter(bytes_recv_per_sec)}/s")
+    
+    def update_network_plot(self):
+        """Redraw the network history graph"""
+        x = self.x_axis[:self.history_len]
+        self.network_sent_line.set_data(x, self.ordered_history(self.network_sent_history))
+        self.network_recv_line.set_data(x, self.ordered_history(self.network_recv_history))
+        
+        # Rescale only when traffic outgrows the y axis or falls well below it,
+        # as new tick labels need a full draw; otherwise just blit the lines
+        peak = float(max(self.network_sent_history.max(), self.network_recv_history.max()))
+        top = self.network_subplot.get_ylim()[1]
+        if peak > top or (top > NETWORK_MIN_YLIM and peak < top / 4):
+            self.network_subplot.set_ylim(0, max(peak * 1.2, NETWORK_MIN_YLIM))
+            self.network_canvas.draw_idle()
+        else:
+            self.network_blitter.update()
     
     def update_ui_system_info(self):
         """Update system information in header"""
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
-        uptime = datetime.now() - boot_time
-        
-        uptime_str = f"Uptime: {uptime.days} days, {uptime.seconds//3600} hours, {(uptime.seconds//60)%60} minutes"
-        self.uptime_label.configure(text=uptime_str)
+        uptime_str = f"Uptime: {format_uptime()}"
+        if uptime_str != self.last_uptime:
+            self.uptime_label.configure(text=uptime_str)
+            self.last_uptime = uptime_str
     
-    def update_dashboard(self, cpu_usage, memory_info, net_io, bytes_sent_per_sec, bytes_recv_per_sec):
+    def update_dashboard(self, avg_cpu, memory_info, bytes_sent_per_sec, bytes_recv_per_sec):
         """Update dashboard overview panel"""
-        # Update CPU gauge
-        avg_cpu = sum(cpu_usage) / len(cpu_usage)
-        self.update_gauge(self.cpu_subplot_gauge, avg_cpu)
-        self.cpu_value_label.configure(text=f"{avg_cpu:.1f}%")
+        self.gauge_values = (avg_cpu, memory_info["percent"])
         
-        # Update Memory gauge
-        self.update_gauge(self.memory_subplot_gauge, memory_info["percent"])
+        sig = (round(avg_cpu, 1), memory_info["percent"], bytes_sent_per_sec, bytes_recv_per_sec)
+        if sig == self.last_dashboard_sig:
+            return
+        self.last_dashboard_sig = sig
+        
+        self.cpu_value_label.configure(text=f"{avg_cpu:.1f}%")
         self.memory_value_label.configure(text=f"{memory_info['percent']:.1f}%")
         
         # Update Network labels
         self.network_down_label.configure(text=f"↓ {size_formatter(bytes_recv_per_sec)}/s")
         self.network_up_label.configure(text=f"↑ {size_formatter(bytes_sent_per_sec)}/s")
-        
-        # Redraw canvases
-        self.cpu_canvas_gauge.draw()
-        self.memory_canvas_gauge.draw()
     
-    def update_gauge(self, subplot, value):
-        """Update a gauge (polar plot) with a value"""
-        subplot.clear()
-        
-        # Background ring (gray)
-        subplot.barh(0, 100, height=0.6, color='gray', alpha=0.3)
+    def update_gauges(self):
+        """Redraw the dashboard gauges with the latest values"""
+        avg_cpu, memory_percent = self.gauge_values
+        self.update_gauge(self.cpu_gauge_wedge, avg_cpu)
+        self.update_gauge(self.memory_gauge_wedge, memory_percent)
+        self.cpu_gauge_blitter.update()
+        self.memory_gauge_blitter.update()
+    
+    def update_gauge(self, wedge, value):
+        """Update a gauge's value wedge"""
+        wedge.set_theta1(90 - 3.6 * value)
         
-        # Foreground ring (colored by value)
+        # Colored by value
         if value < 60:
             color = 'green'
         elif value < 80:
@@ -788,50 +1226,49 @@ class SystemMonitorGUI:
         else:
             color = 'red'
         
-        subplot.barh(0, value, height=0.6, color=color)
-        
-        # Remove axis ticks and labels
-        subplot.set_xticks([])
-        subplot.set_yticks([])
-        
-        # Only show necessary spines
-        for spine in subplot.spines.values():
-            spine.set_visible(False)
+        wedge.set_color(color)
+    
+    def on_visibility_change(self, event):
+        """Track whether the main window is shown"""
+        if event.widget is not self.root:
+            return
+        self.visible = event.type == tk.EventType.Map
+        if self.visible:
+            # Catch up on what was skipped while hidden
+            self.last_slow = float("-inf")
+            self.request_redraw()
     
     def show_window(self):
         """Show window from system tray"""
-        if SYSTRAY_AVAILABLE:
-            self.tray_icon.stop()
+        if self.tray_icon is not None:
+            self.tray_icon.visible = False
             self.root.after(0, self.root.deiconify)
     
     def minimize_to_tray(self):
         """Minimize to system tray"""
-        if SYSTRAY_AVAILABLE:
+        if self.tray_icon is not None:
             self.root.withdraw()
-            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+            self.tray_icon.visible = True
     
     def exit_app(self):
         """Exit application from tray"""
-        if SYSTRAY_AVAILABLE:
-            self.tray_icon.stop()
         self.on_closing()
     
-    def check_thresholds(self, cpu_usage, memory_info):
+    def check_thresholds(self, avg_cpu, memory_info):
         """Check if any resources exceed thresholds and notify"""
         # CPU threshold
-        avg_cpu = sum(cpu_usage) / len(cpu_usage)
-        if avg_cpu > 90 and not hasattr(self, 'cpu_notified'):
+        if avg_cpu > 90 and not self.cpu_notified:
             notify('VitalViz Alert', 'CPU usage is extremely high (>90%)')
             self.cpu_notified = True
-        elif avg_cpu < 70 and hasattr(self, 'cpu_notified'):
-            delattr(self, 'cpu_notified')
+        elif avg_cpu < 70 and self.cpu_notified:
+            self.cpu_notified = False
             
         # Memory threshold
-        if memory_info["percent"] > 85 and not hasattr(self, 'memory_notified'):
+        if memory_info["percent"] > 85 and not self.memory_notified:
             notify('VitalViz Alert', 'Memory usage is high (>85%)')
             self.memory_notified = True
-        elif memory_info["percent"] < 75 and hasattr(self, 'memory_notified'):
-            delattr(self, 'memory_notified')
+        elif memory_info["percent"] < 75 and self.memory_notified:
+            self.memory_notified = False
     
     def toggle_theme(self):
         """Toggle between light and dark theme"""
@@ -839,43 +1276,79 @@ class SystemMonitorGUI:
         self.current_theme = new_theme
         ctk.set_appearance_mode(new_theme)
         
-        # Update matplotlib style
-        if new_theme == "dark":
-            plt.style.use('dark_background')
-        else:
-            plt.style.use('default')
-        
-        # Redraw all charts
-        try:
-            self.update_ui_cpu(get_cpu_usage_per_core())
-            self.update_ui_memory(get_memory_info())
-            self.update_ui_network(get_network_info(), 0, 0)
-            self.update_dashboard(get_cpu_usage_per_core(), get_memory_info(), 
-                              get_network_info(), 0, 0)
-        except Exception as e:
-            print(f"Error updating UI after theme change: {e}")
+        # Recolor in one idle callback, once Tk has applied the new appearance
+        self.root.after_idle(self.apply_chart_palette)
     
     def apply_theme(self):
         """Apply the selected theme"""
         ctk.set_appearance_mode(self.current_theme)
-        
-        # Update matplotlib style
-        if self.current_theme == "dark":
-            plt.style.use('dark_background')
-        else:
-            plt.style.use('default')
+        self.apply_chart_palette()
+    
+    def apply_chart_palette(self):
+        """Recolor the existing charts in place for the current theme"""
+        if not self.charts_ready:
+            return
+        palette = CHART_PALETTES[self.current_theme]
+        face, text = palette["face"], palette["text"]
+        
+        for fig, canvas in ((self.cpu_fig_gauge, self.cpu_canvas_gauge),
+                            (self.memory_fig_gauge, self.memory_canvas_gauge),
+                            (self.cpu_fig, self.cpu_canvas),
+                            (self.memory_fig, self.memory_canvas),
+                            (self.network_fig, self.network_canvas)):
+            fig.set_facecolor(face)
+            for ax in fig.axes:
+                ax.set_facecolor(face)
+                if not ax.axison:
+                    continue  # Gauges have no decorations
+                ax.tick_params(colors=text)
+                ax.title.set_color(text)
+                ax.xaxis.label.set_color(text)
+                ax.yaxis.label.set_color(text)
+                ax.grid(True, color=palette["grid"])
+                for spine in ax.spines.values():
+                    spine.set_edgecolor(text)
+                legend = ax.get_legend()
+                if legend is not None:
+                    legend.get_frame().set_facecolor(face)
+                    legend.get_frame().set_edgecolor(text)
+                    for legend_text in legend.get_texts():
+                        legend_text.set_color(text)
+            # The full draw also recaptures the blit backgrounds
+            canvas.draw_idle()
+    
+    def make_modal(self, dialog):
+        """Grab input for a dialog and pause chart redraws until it closes"""
+        dialog.transient(self.root)
+        dialog.grab_set()
+        self.modal_open = True
+        dialog.bind("<Destroy>", lambda event: self.close_modal() if event.widget is dialog else None, add="+")
+    
+    def close_modal(self):
+        """Resume chart redraws after a modal dialog closes"""
+        self.modal_open = False
+        self.request_redraw()
     
     def toggle_always_on_top(self):
         """Toggle always on top setting"""
         self.root.attributes('-topmost', self.always_on_top.get())
     
+    def toggle_cpu_toolbar(self):
+        """Show or hide the CPU graph navigation toolbar"""
+        if not self.charts_ready:
+            return  # Applied once the charts are created
+        if self.show_cpu_toolbar.get():
+            if self.cpu_toolbar is None:
+                self.cpu_toolbar = load_matplotlib().NavigationToolbar2Tk(self.cpu_canvas, self.cpu_toolbar_frame)
+                self.cpu_toolbar.update()
+            self.cpu_toolbar_frame.pack(fill="x")
+        else:
+            self.cpu_toolbar_frame.pack_forget()
+    
     def reset_graphs(self):
         """Reset all graph history data"""
-        self.cpu_history = [[] for _ in range(len(get_cpu_usage_per_core()))]
-        self.memory_history = []
-        self.network_recv_history = []
-        self.network_sent_history = []
-        self.time_points = []
+        self.clear_history()
+        self.request_redraw()
         messagebox.showinfo("Graphs Reset", "All graph history has been cleared.")
     
     def show_about(self):
@@ -884,8 +1357,7 @@ class SystemMonitorGUI:
         about_dialog.title("About VitalViz")
         about_dialog.geometry("400x300")
         about_dialog.resizable(False, False)
-        about_dialog.transient(self.root)
-        about_dialog.grab_set()
+        self.make_modal(about_dialog)
         
         ctk.CTkLabel(
             about_dialog, 
@@ -911,10 +1383,68 @@ class SystemMonitorGUI:
             command=about_dialog.destroy
         ).pack(pady=20)
     
+    def request_processes(self):
+        """Start collecting the process list in the background"""
+        if self.process_future is None:
+            self.process_future = self.pool.submit(get_process_info)
+    
+    def update_ui_processes(self, processes):
+        """Update process list"""
+        self.processes = processes
+        self.show_processes()
+    
     def filter_processes(self, *args):
-        """Filter process list by search term"""
+        """Filter process list by search term, once typing pauses"""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(150, self.show_processes)
+    
+    def show_processes(self):
+        """Show the last sampled processes, filtered and sorted"""
+        self.filter_job = None
         search_term = self.search_var.get().lower()
-        # Implementation to be added
+        key, reverse = PROCESS_SORT_KEYS[self.sort_var.get()]
+        
+        rows = [p for p in self.processes if search_term in p["name"].lower()]
+        rows.sort(key=lambda p: p[key], reverse=reverse)
+        
+        seen = set()
+        order = []
+        
+        # Update changed rows in place and add new processes
+        for p in rows:
+            pid = p["pid"]
+            seen.add(pid)
+            values = (
+                pid,
+                p["name"],
+                f"{p['cpu_percent']:.1f}",
+                f"{p['memory_percent']:.1f}",
+                p["status"]
+            )
+            
+            if pid in self.process_items:
+                iid, old_values = self.process_items[pid]
+                if values != old_values:
+                    self.process_tree.item(iid, values=values)
+            else:
+                iid = self.process_tree.insert("", "end", values=values)
+            self.process_items[pid] = (iid, values)
+            order.append(iid)
+        
+        # Drop processes that exited or no longer match the search
+        for pid in list(self.process_items):
+            if pid not in seen:
+                iid, _ = self.process_items.pop(pid)
+                self.process_tree.delete(iid)
+        
+        # Move only the rows that are out of place
+        current = list(self.process_tree.get_children())
+        for index, iid in enumerate(order):
+            if current[index] != iid:
+                self.process_tree.move(iid, "", index)
+                current.remove(iid)
+                current.insert(index, iid)
     
     def show_process_menu(self, event):
         """Show context menu for process"""
@@ -947,10 +1477,9 @@ class SystemMonitorGUI:
         """Create settings dialog window"""
         settings_win = ctk.CTkToplevel(self.root)
         settings_win.title("VitalViz Settings")
-        settings_win.geometry("400x300")
+        settings_win.geometry("400x400")
         settings_win.resizable(False, False)
-        settings_win.transient(self.root)
-        settings_win.grab_set()
+        self.make_modal(settings_win)
         
         # Theme selection
         ctk.CTkLabel(settings_win, text="Theme:").grid(row=0, column=0, padx=10, pady=10, sticky="w")
@@ -970,22 +1499,39 @@ class SystemMonitorGUI:
         history_spin = ctk.CTkEntry(settings_win, textvariable=history_var, width=50)
         history_spin.grid(row=2, column=1, padx=10, pady=10, sticky="w")
         
+        # Chart redraw rate
+        ctk.CTkLabel(settings_win, text="Redraw charts every (updates):").grid(row=3, column=0, padx=10, pady=10, sticky="w")
+        draw_skip_var = ctk.IntVar(value=self.draw_skip)
+        draw_skip_spin = ctk.CTkEntry(settings_win, textvariable=draw_skip_var, width=50)
+        draw_skip_spin.grid(row=3, column=1, padx=10, pady=10, sticky="w")
+        
+        ctk.CTkLabel(settings_win, text="Max chart redraws per second:").grid(row=4, column=0, padx=10, pady=10, sticky="w")
+        redraw_rate_var = ctk.IntVar(value=self.max_redraw_rate)
+        redraw_rate_spin = ctk.CTkEntry(settings_win, textvariable=redraw_rate_var, width=50)
+        redraw_rate_spin.grid(row=4, column=1, padx=10, pady=10, sticky="w")
+        
         # Enable notifications checkbox
         notifications_var = ctk.BooleanVar(value=self.enable_notifications)
         notifications_check = ctk.CTkCheckBox(settings_win, text="Enable notifications", variable=notifications_var)
-        notifications_check.grid(row=3, column=0, columnspan=2, padx=10, pady=10, sticky="w")
+        notifications_check.grid(row=5, column=0, columnspan=2, padx=10, pady=10, sticky="w")
         
         # Buttons
         def save_settings():
             self.current_theme = theme_var.get().lower()
             self.update_interval = int(interval_var.get())
-            self.max_history = int(history_var.get())
+            max_history = max(2, int(history_var.get()))
+            if max_history != self.max_history:
+                self.max_history = max_history
+                self.init_history()
+                self.init_plots()
+            self.draw_skip = max(1, int(draw_skip_var.get()))
+            self.max_redraw_rate = max(1, int(redraw_rate_var.get()))
             self.enable_notifications = notifications_var.get()
             self.apply_theme()
             settings_win.destroy()
         
-        ctk.CTkButton(settings_win, text="Save", command=save_settings).grid(row=4, column=0, padx=10, pady=20)
-        ctk.CTkButton(settings_win, text="Cancel", command=settings_win.destroy).grid(row=4, column=1, padx=10, pady=20)
+        ctk.CTkButton(settings_win, text="Save", command=save_settings).grid(row=6, column=0, padx=10, pady=20)
+        ctk.CTkButton(settings_win, text="Cancel", command=settings_win.destroy).grid(row=6, column=1, padx=10, pady=20)
     
     def export_data(self):
         """Export monitoring data"""
@@ -993,8 +1539,7 @@ class SystemMonitorGUI:
         export_dialog = ctk.CTkToplevel(self.root)
         export_dialog.title("Export Options")
         export_dialog.geometry("300x200")
-        export_dialog.transient(self.root)
-        export_dialog.grab_set()
+        self.make_modal(export_dialog)
         
         # Export format options
         ctk.CTkLabel(export_dialog, text="Export Format:").pack(pady=(10, 5))
@@ -1030,9 +1575,6 @@ class SystemMonitorGUI:
     
     def export_to_csv(self):
         """Export data to CSV format"""
-        from tkinter import filedialog
-        import csv
-        
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
@@ -1050,21 +1592,16 @@ class SystemMonitorGUI:
                 writer.writerow(["Timestamp", "CPU Avg %", "Memory %", 
                                 "Network Send (B/s)", "Network Receive (B/s)"])
                 
-                # Write data
-                cpu_data = self.cpu_history
-                for i in range(len(self.memory_history)):
-                    if i < len(self.time_points):
-                        timestamp = self.time_points[i]
-                    else:
-                        timestamp = datetime.now().strftime("%H:%M:%S")
-                        
-                    avg_cpu = sum(history[i] for history in cpu_data if i < len(history)) / len(cpu_data)
-                    memory = self.memory_history[i] if i < len(self.memory_history) else 0
-                    net_send = self.network_sent_history[i] if i < len(self.network_sent_history) else 0
-                    net_recv = self.network_recv_history[i] if i < len(self.network_recv_history) else 0
-                    
-                    writer.writerow([timestamp, f"{avg_cpu:.2f}", f"{memory:.2f}", 
-                                    f"{net_send:.2f}", f"{net_recv:.2f}"])
+                # Write data, formatting each column in one vectorized pass
+                timestamps = [datetime.fromtimestamp(t).strftime("%H:%M:%S")
+                              for t in self.ordered_history(self.time_points).tolist()]
+                columns = (
+                    self.ordered_history(self.cpu_history).mean(axis=0),
+                    self.ordered_history(self.memory_history),
+                    self.ordered_history(self.network_sent_history),
+                    self.ordered_history(self.network_recv_history)
+                )
+                writer.writerows(zip(timestamps, *(np.char.mod("%.2f", column) for column in columns)))
             
             # Show success message
             messagebox.showinfo("Export Successful", f"Data exported to {filename}")
@@ -1073,9 +1610,6 @@ class SystemMonitorGUI:
     
     def export_to_json(self):
         """Export data to JSON format"""
-        from tkinter import filedialog
-        import json
-        
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -1095,17 +1629,25 @@ class SystemMonitorGUI:
                     "machine": platform.machine(),
                     "processor": platform.processor(),
                 },
-                "timestamps": self.time_points,
-                "cpu_data": [hist for hist in self.cpu_history],
-                "memory_data": self.memory_history,
+                "timestamps": [
+                    datetime.fromtimestamp(t).strftime("%H:%M:%S")
+                    for t in self.ordered_history(self.time_points).tolist()
+                ],
+                "cpu_data": self.exported_history(self.cpu_history),
+                "memory_data": self.exported_history(self.memory_history),
                 "network_data": {
-                    "sent": self.network_sent_history,
-                    "received": self.network_recv_history
+                    "sent": self.exported_history(self.network_sent_history),
+                    "received": self.exported_history(self.network_recv_history)
                 }
             }
             
-            with open(filename, 'w') as jsonfile:
-                json.dump(data, jsonfile, indent=2)
+            # Compact output; orjson serializes several times faster when installed
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as jsonfile:
+                    jsonfile.write(orjson.dumps(data))
+            else:
+                with open(filename, 'w') as jsonfile:
+                    json.dump(data, jsonfile, separators=(",", ":"))
                 
             # Show success message
             messagebox.showinfo("Export Successful", f"Data exported to {filename}")
@@ -1114,9 +1656,6 @@ class SystemMonitorGUI:
     
     def export_screenshots(self):
         """Export screenshots of all graphs"""
-        from tkinter import filedialog
-        import os
-        
         directory = filedialog.askdirectory(
             title="Select Directory for Screenshots"
         )
@@ -1129,15 +1668,18 @@ class SystemMonitorGUI:
             
             # Save CPU chart
             cpu_filename = os.path.join(directory, f"vitalviz_cpu_{timestamp}.png")
-            self.cpu_fig.savefig(cpu_filename, dpi=150)
+            with self.cpu_blitter.static_artists():
+                self.cpu_fig.savefig(cpu_filename, dpi=150)
             
             # Save memory chart
             memory_filename = os.path.join(directory, f"vitalviz_memory_{timestamp}.png")
-            self.memory_fig.savefig(memory_filename, dpi=150)
+            with self.memory_blitter.static_artists():
+                self.memory_fig.savefig(memory_filename, dpi=150)
             
             # Save network chart
             network_filename = os.path.join(directory, f"vitalviz_network_{timestamp}.png")
-            self.network_fig.savefig(network_filename, dpi=150)
+            with self.network_blitter.static_artists():
+                self.network_fig.savefig(network_filename, dpi=150)
             
             # Show success message
             messagebox.showinfo("Export Successful", 
@@ -1147,7 +1689,13 @@ class SystemMonitorGUI:
     
     def on_closing(self):
         """Clean up when window is closed"""
-        self.running = False
+        self.root.after_cancel(self.update_job)
+        if self.redraw_job is not None:
+            self.root.after_cancel(self.redraw_job)
+        self.pool.shutdown(wait=False)
+        # The tray loop runs for the app's lifetime, so stop it on every exit path
+        if self.tray_icon is not None:
+            self.tray_icon.stop()
         self.root.destroy()
 
 if __name__ == "__main__":